@@ -0,0 +1,469 @@
+#!/usr/bin/env python3
+"""
+Consciousness Physics Batch Runner - The Conlin Equations at Scale
+Evaluates scenario files (CSV or JSON) with the physics calculator and
+only recomputes the rows that changed since the last run.
+
+Results are cached per block of rows. A block's key hashes its bytes
+together with the factor-table and threshold versions, so editing a
+scenario, a factor table or an interpretation threshold invalidates
+exactly the blocks that depend on it. Unchanged files aren't re-parsed.
+"""
+
+import argparse
+import csv
+import hashlib
+import importlib.util
+import inspect
+import io
+import json
+import math
+import os
+import re
+import sys
+import tempfile
+import zlib
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# physics-calculator.py isn't importable by name, so load it from its path
+_spec = importlib.util.spec_from_file_location(
+    "physics_calculator", Path(__file__).with_name("physics-calculator.py"))
+physics_calculator = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(physics_calculator)
+
+ConsciousnessCalculator = physics_calculator.ConsciousnessCalculator
+Mode = physics_calculator.Mode
+
+SCENARIO_FIELDS = ('name', 'pattern', 'attention', 'reality_resistance', 'mode')
+OUTPUT_FIELDS = ('source', 'scenario', 'mode', 'equation', 'result', 'interpretation', 'error')
+CACHE_FORMAT = 3
+
+# Blocks end after a CSV line or JSON element whose CRC is divisible by
+# this, so they average this many rows and an inserted or deleted row only
+# disturbs its own block
+BLOCK_LINES = 256
+MAX_BLOCK_LINES = BLOCK_LINES * 4
+
+
+def _digest(obj) -> str:
+    """Stable hash of any JSON-serialisable value"""
+    data = json.dumps(obj, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+    return hashlib.sha256(data.encode('utf-8')).hexdigest()
+
+
+def factor_table_version(calc: ConsciousnessCalculator) -> str:
+    """Version of the pattern, attention and reality factor tables"""
+    return _digest({
+        'pattern_strengths': calc.pattern_strengths,
+        'attention_factors': calc.attention_factors,
+        'reality_factors': calc.reality_factors,
+    })[:16]
+
+
+def threshold_version(calc: ConsciousnessCalculator) -> str:
+    """Version of the interpretation and suggestion thresholds
+
+    The thresholds live in code, so the version is the hash of that code.
+    """
+    source = (inspect.getsource(type(calc).calculate) +
+              inspect.getsource(type(calc)._interpret_outcome) +
+              inspect.getsource(type(calc)._suggest_optimizations))
+    return _digest(source)[:16]
+
+
+MODE_ALIASES = {alias: mode for mode in Mode for alias in (mode.name, mode.value)}
+MODE_ALIASES.update({'X': Mode.CREATION, '*': Mode.CREATION})
+
+
+def parse_mode(value: str) -> Mode:
+    """Accept either the mode name or its operator (× or /)"""
+    try:
+        return MODE_ALIASES[str(value).strip().upper()]
+    except KeyError:
+        raise ValueError(f"Unknown mode: {value!r}") from None
+
+
+def csv_blocks(data: bytes) -> Tuple[bytes, List[bytes]]:
+    """Split CSV bytes into the header line and content-defined row blocks
+
+    Blocks are only cut at line ends outside quoted fields, so a quoted
+    field containing a newline always stays within one block.
+    """
+    lines = data.split(b'\n')
+    if lines and lines[-1] == b'':
+        lines.pop()
+    lines = [line + b'\n' for line in lines]
+    quoted = b'"' in data
+
+    header_end = 1
+    if quoted:
+        while header_end < len(lines) and b''.join(lines[:header_end]).count(b'"') % 2:
+            header_end += 1
+    header = b''.join(lines[:header_end])
+
+    blocks = []
+    start = header_end
+    quotes = 0
+    for i in range(header_end, len(lines)):
+        if quoted:
+            quotes += lines[i].count(b'"')
+            if quotes % 2:
+                continue
+        if zlib.crc32(lines[i]) % BLOCK_LINES == 0 or i + 1 - start >= MAX_BLOCK_LINES:
+            blocks.append(b''.join(lines[start:i + 1]))
+            start = i + 1
+    if start < len(lines):
+        blocks.append(b''.join(lines[start:]))
+    return header, blocks
+
+
+_JSON_SPACE = re.compile(r'[ \t\n\r]*')
+_JSON_SEPARATOR = re.compile(r'[ \t\n\r]*([,\]])[ \t\n\r]*')
+
+
+def json_blocks(data: bytes) -> List[bytes]:
+    """Split a JSON array into content-defined blocks of elements
+
+    Each block is itself a JSON array holding the elements' original text,
+    cut at the same kind of boundary as csv_blocks().
+    """
+    text = data.decode('utf-8-sig')
+    scan = json.JSONDecoder().scan_once
+    pos = _JSON_SPACE.match(text).end()
+    if not text.startswith('[', pos):
+        raise ValueError("expected a list of scenario objects")
+    pos = _JSON_SPACE.match(text, pos + 1).end()
+
+    elements = []
+    if text.startswith(']', pos):
+        pos += 1
+    else:
+        while True:
+            try:
+                _, end = scan(text, pos)
+            except StopIteration:
+                raise ValueError(f"expected a value at char {pos}") from None
+            elements.append(text[pos:end])
+            separator = _JSON_SEPARATOR.match(text, end)
+            if separator is None:
+                raise ValueError(f"expected ',' or ']' at char {end}")
+            pos = separator.end()
+            if separator.group(1) == ']':
+                break
+    if _JSON_SPACE.match(text, pos).end() != len(text):
+        raise ValueError(f"extra data after the list at char {pos}")
+
+    blocks = []
+    start = 0
+    for i, element in enumerate(elements):
+        encoded = element.encode('utf-8')
+        if zlib.crc32(encoded) % BLOCK_LINES == 0 or i + 1 - start >= MAX_BLOCK_LINES:
+            blocks.append(('[' + ','.join(elements[start:i + 1]) + ']').encode('utf-8'))
+            start = i + 1
+    if start < len(elements):
+        blocks.append(('[' + ','.join(elements[start:]) + ']').encode('utf-8'))
+    return blocks
+
+
+def csv_fields(header: bytes) -> List[str]:
+    """Column names from a CSV header line"""
+    return next(csv.reader([header.decode('utf-8-sig')]), [])
+
+
+def read_rows(path: Path, header: Optional[bytes], block: bytes) -> List[Dict]:
+    """Parse one block of a scenario file into raw rows
+
+    CSV blocks are parsed against the file's header line; JSON blocks are
+    arrays of objects with the same fields, as produced by json_blocks().
+    """
+    if header is None:
+        return json.loads(block.decode('utf-8'))
+    return list(csv.DictReader(io.StringIO(block.decode('utf-8'), newline=''),
+                               fieldnames=csv_fields(header)))
+
+
+def scenario_from_row(path: Path, row: Dict) -> Dict:
+    """Validate a raw row and convert it to a scenario"""
+    if not isinstance(row, dict):
+        raise ValueError(f"expected a scenario object, got {type(row).__name__}")
+    missing = [field for field in SCENARIO_FIELDS if row.get(field) is None]
+    if missing:
+        raise ValueError(f"missing {', '.join(missing)}")
+    scenario = {'source': str(path), 'name': str(row['name'])}
+    for field in ('pattern', 'attention', 'reality_resistance'):
+        try:
+            scenario[field] = float(row[field])
+        except (TypeError, ValueError):
+            raise ValueError(f"{field} {row[field]!r} is not a number") from None
+        if not math.isfinite(scenario[field]):
+            raise ValueError(f"{field} {row[field]!r} is not a finite number")
+    scenario['mode'] = parse_mode(row['mode']).name
+    return scenario
+
+
+def evaluate(calc: ConsciousnessCalculator, scenario: Dict) -> Dict:
+    """Run one scenario through the calculator, keeping the output fields"""
+    if scenario['mode'] == Mode.TRANSFORMATION.name and scenario['reality_resistance'] == 0:
+        raise ValueError("reality_resistance must be non-zero in TRANSFORMATION mode")
+    if scenario['pattern'] < 0 and not scenario['attention'].is_integer():
+        raise ValueError("negative pattern with fractional attention has no real result")
+    try:
+        result = calc.calculate(scenario['pattern'], scenario['attention'],
+                                scenario['reality_resistance'], Mode[scenario['mode']])
+    except OverflowError:
+        raise ValueError("result is too large to represent") from None
+    # P^A can stay finite while × R overflows to infinity without raising
+    if not math.isfinite(result['result']):
+        raise ValueError("result is too large to represent")
+    return {
+        'source': scenario['source'],
+        'scenario': scenario['name'],
+        'mode': result['mode'],
+        'equation': result['equation'],
+        'result': result['result'],
+        'interpretation': result['interpretation'],
+        'error': None,
+    }
+
+
+def evaluate_block(calc: ConsciousnessCalculator, path: Path, header: Optional[bytes],
+                   block: bytes, start_row: int) -> List[Dict]:
+    """Evaluate every row of a block; start_row numbers rows in messages
+
+    A row that can't be evaluated is recorded with an error instead of
+    aborting the whole batch.
+    """
+    results = []
+    for i, row in enumerate(read_rows(path, header, block)):
+        try:
+            results.append(evaluate(calc, scenario_from_row(path, row)))
+        except (ValueError, ArithmeticError) as e:
+            result = dict.fromkeys(OUTPUT_FIELDS)
+            result['source'] = str(path)
+            if isinstance(row, dict) and row.get('name') is not None:
+                result['scenario'] = str(row['name'])
+            result['error'] = f"{path} row {start_row + i}: {e}"
+            results.append(result)
+    return results
+
+
+def format_results(results: List[Dict], fmt: str) -> str:
+    """Serialise a block of results as CSV rows or JSON array items"""
+    if fmt == 'csv':
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=OUTPUT_FIELDS)
+        writer.writerows(results)
+        return buffer.getvalue()
+    return ',\n'.join('  ' + json.dumps(r, ensure_ascii=False) for r in results)
+
+
+def join_results(texts: List[str], fmt: str) -> str:
+    """Assemble formatted blocks into a complete results file"""
+    if fmt == 'csv':
+        buffer = io.StringIO()
+        csv.writer(buffer).writerow(OUTPUT_FIELDS)
+        return buffer.getvalue() + ''.join(texts)
+    items = [text for text in texts if text]
+    return '[\n' + ',\n'.join(items) + '\n]\n' if items else '[]\n'
+
+
+def load_manifest(cache_dir: Path) -> Dict:
+    """Read the small cache manifest, starting fresh if it's missing or stale
+
+    The manifest maps each input file to the keys of its cached blocks; the
+    block results themselves live in separate files and are only read when
+    the results file has to be rebuilt.
+    """
+    try:
+        with open(cache_dir / 'manifest.json', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        manifest = None
+    if not manifest or manifest.get('format') != CACHE_FORMAT:
+        return {'format': CACHE_FORMAT, 'inputs': None, 'files': {}, 'blocks': {}}
+    return manifest
+
+
+def write_atomic(path: Path, text: str):
+    """Write text to path so readers never see a half-written file"""
+    path = Path(path)
+    try:
+        mode = path.stat().st_mode & 0o777
+    except FileNotFoundError:
+        # mkstemp creates files as 0600; use what open() would have given
+        umask = os.umask(0)
+        os.umask(umask)
+        mode = 0o666 & ~umask
+    fd, tmp = tempfile.mkstemp(dir=path.parent or '.', prefix=f".{path.name}.", suffix='.tmp')
+    try:
+        os.fchmod(fd, mode)
+        with os.fdopen(fd, 'w', encoding='utf-8', newline='') as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def _count(files: Dict, blocks: Dict, field: str) -> int:
+    """Sum a block statistic over every block of every file"""
+    return sum(blocks[key][field] for entry in files.values() for key in entry['blocks'])
+
+
+def run_batch(scenario_files: List[Path], output: Path, cache_dir: Path) -> Dict:
+    """
+    Evaluate scenario files, recomputing only blocks of rows that changed.
+
+    Args:
+        scenario_files: CSV or JSON scenario files
+        output: Where to write the results (.csv or .json)
+        cache_dir: Directory holding the manifest and cached block results
+
+    Returns:
+        Run statistics. The results themselves are in the output file;
+        'unchanged' is True when it was already up to date and not rewritten,
+        and 'errors' counts rows recorded with an error instead of a result.
+    """
+    output, cache_dir = Path(output), Path(cache_dir)
+    fmt = 'csv' if output.suffix.lower() == '.csv' else 'json'
+    calc = ConsciousnessCalculator()
+    versions = {
+        'factors': factor_table_version(calc),
+        'thresholds': threshold_version(calc),
+    }
+    manifest = load_manifest(cache_dir)
+
+    # Fast path: answered from the manifest and file hashes alone
+    contents = {str(p): Path(p).read_bytes() for p in scenario_files}
+    file_hashes = {p: hashlib.sha256(data).hexdigest() for p, data in contents.items()}
+    inputs = {'files': file_hashes, 'versions': versions, 'output': str(output)}
+    if manifest['inputs'] == inputs and output.exists():
+        rows = _count(manifest['files'], manifest['blocks'], 'rows')
+        return {'rows': rows, 'recomputed': 0, 'reused': rows, 'unchanged': True,
+                'errors': _count(manifest['files'], manifest['blocks'], 'errors')}
+
+    same_versions = manifest['inputs'] is not None and \
+        manifest['inputs']['versions'] == versions and manifest.get('output_format') == fmt
+    old_files = manifest['files'] if same_versions else {}
+    old_blocks = manifest['blocks'] if same_versions else {}
+    blocks_dir = cache_dir / 'blocks'
+    blocks_dir.mkdir(parents=True, exist_ok=True)
+
+    files, blocks, texts = {}, {}, []
+    recomputed = 0
+
+    def cached_text(key):
+        if key not in old_blocks:
+            return None
+        try:
+            with open(blocks_dir / key, encoding='utf-8', newline='') as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    for path, data in contents.items():
+        old = old_files.get(path)
+        if old and old['sha256'] == file_hashes[path]:
+            # Unchanged file: reuse its block list without re-parsing it
+            file_texts = [cached_text(key) for key in old['blocks']]
+            if None not in file_texts:
+                files[path] = old
+                for key in old['blocks']:
+                    blocks[key] = old_blocks[key]
+                texts.extend(file_texts)
+                continue
+
+        if Path(path).suffix.lower() == '.json':
+            try:
+                header, file_blocks = None, json_blocks(data)
+            except ValueError as e:
+                raise ValueError(f"{path}: {e}") from None
+        elif Path(path).suffix.lower() == '.csv':
+            header, file_blocks = csv_blocks(data)
+            # Checked here so a header-only file with wrong columns fails too
+            missing = [field for field in SCENARIO_FIELDS if field not in csv_fields(header)]
+            if missing:
+                raise ValueError(f"{path}: missing columns {', '.join(missing)}")
+        else:
+            raise ValueError(f"Unsupported scenario file: {path}")
+
+        keys = []
+        start_row = 1
+        for block in file_blocks:
+            h = hashlib.sha256()
+            h.update(_digest([versions, path, fmt]).encode())
+            h.update(header or b'')
+            h.update(block)
+            key = h.hexdigest()
+            # Error messages carry row numbers, so blocks with errors are
+            # also keyed by where they start
+            text = cached_text(key)
+            if text is None:
+                key = f"{h.hexdigest()}-{start_row}"
+                text = cached_text(key)
+            if text is None:
+                results = evaluate_block(calc, Path(path), header, block, start_row)
+                errors = sum(1 for r in results if r['error'])
+                key = f"{h.hexdigest()}-{start_row}" if errors else h.hexdigest()
+                text = format_results(results, fmt)
+                write_atomic(blocks_dir / key, text)
+                blocks[key] = {'rows': len(results), 'errors': errors}
+                recomputed += len(results)
+            else:
+                blocks[key] = old_blocks[key]
+            keys.append(key)
+            texts.append(text)
+            start_row += blocks[key]['rows']
+        files[path] = {'sha256': file_hashes[path], 'blocks': keys}
+
+    write_atomic(output, join_results(texts, fmt))
+    write_atomic(cache_dir / 'manifest.json', json.dumps({
+        'format': CACHE_FORMAT, 'inputs': inputs, 'output_format': fmt,
+        'files': files, 'blocks': blocks,
+    }, separators=(',', ':')))
+
+    # Blocks no longer referenced by any file drop out of the cache here
+    for entry in os.scandir(blocks_dir):
+        if entry.name not in blocks:
+            os.unlink(entry.path)
+
+    total = _count(files, blocks, 'rows')
+    return {'rows': total, 'recomputed': recomputed, 'reused': total - recomputed,
+            'unchanged': False, 'errors': _count(files, blocks, 'errors')}
+
+
+def main():
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(
+        description="Evaluate scenario files with The Conlin Equations, incrementally")
+    parser.add_argument('scenarios', nargs='+', type=Path,
+                        help="Scenario files (.csv or .json)")
+    parser.add_argument('-o', '--output', type=Path, default=Path('results.json'),
+                        help="Results file (.csv or .json, default: results.json)")
+    parser.add_argument('--cache', type=Path, default=Path('.batch-cache'),
+                        help="Cache directory (default: .batch-cache)")
+    args = parser.parse_args()
+
+    try:
+        stats = run_batch(args.scenarios, args.output, args.cache)
+    except (ValueError, OSError) as e:
+        parser.exit(2, f"{parser.prog}: error: {e}\n")
+
+    print("=== Consciousness Physics Batch Runner ===")
+    if stats['unchanged']:
+        print(f"No changes - {stats['rows']} results already up to date in {args.output}")
+    else:
+        print(f"Rows: {stats['rows']}")
+        print(f"  Recomputed: {stats['recomputed']}")
+        print(f"  Reused from cache: {stats['reused']}")
+        print(f"Results written to {args.output}")
+    if stats['errors']:
+        print(f"{stats['errors']} rows could not be evaluated - see the error column")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
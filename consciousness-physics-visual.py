@@ -4,11 +4,34 @@ Visual generator for The Conlin Equations
 Creates matplotlib visualizations of consciousness physics
 """
 
+import bisect
+import importlib.util
+import json
+import os
+from datetime import datetime
+
 import matplotlib.pyplot as plt
+import matplotlib.dates as mdates
 import numpy as np
 from matplotlib.patches import FancyBboxPatch
+from matplotlib.transforms import Bbox
 import matplotlib.patches as mpatches
 
+# mode-detector.py isn't importable by name, so load it from its path
+_spec = importlib.util.spec_from_file_location(
+    "mode_detector", os.path.join(os.path.dirname(os.path.abspath(__file__)), "mode-detector.py"))
+mode_detector = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(mode_detector)
+
+ConsciousnessMode = mode_detector.ConsciousnessMode
+
+# Numeric levels for the modes reported by detect_mode()
+MODE_LEVELS = {
+    ConsciousnessMode.CREATION: 1.0,
+    ConsciousnessMode.MIXED: 0.0,
+    ConsciousnessMode.TRANSFORMATION: -1.0,
+}
+
 def create_dual_mode_visualization():
     """Create a visualization showing both modes of consciousness"""
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
@@ -159,6 +182,232 @@ def create_practical_applications():
     plt.savefig('practical-applications.png', dpi=300, bbox_inches='tight')
     plt.close()
 
+def detection_record(mode, confidence, analysis, energy_level=None, time=None):
+    """Turn a detect_mode() result into a timeline log record"""
+    time = time or datetime.now()
+    energy = energy_level
+    if energy is None:
+        # Fall back to the detector's coarse energy state
+        state = analysis.get('energy_analysis', {}).get('energy_state')
+        energy = {'high': 9, 'medium': 6, 'low': 3}.get(state)
+    return {
+        'time': time.isoformat(),
+        'mode': mode,
+        'confidence': confidence,
+        'energy': energy,
+    }
+
+
+def load_detection_log(path):
+    """Load detection records stored one JSON object per line"""
+    records = []
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                records.append(json.loads(line))
+    records.sort(key=lambda r: r['time'])
+    return records
+
+
+def _record_values(record):
+    """Time (matplotlib date number), mode level, confidence and energy"""
+    if record['mode'] not in MODE_LEVELS:
+        raise ValueError(f"Unknown mode: {record['mode']!r}")
+    return (mdates.date2num(datetime.fromisoformat(record['time'])),
+            MODE_LEVELS[record['mode']],
+            record['confidence'],
+            np.nan if record.get('energy') is None else record['energy'])
+
+
+def _records_arrays(records):
+    """Times, mode levels, confidences and energies of many records at once
+
+    Converting every time in one date2num call is far faster than calling
+    _record_values() per record.
+    """
+    unknown = {record['mode'] for record in records} - MODE_LEVELS.keys()
+    if unknown:
+        raise ValueError(f"Unknown mode: {sorted(unknown)[0]!r}")
+    times = mdates.date2num(np.array([datetime.fromisoformat(record['time'])
+                                      for record in records]))
+    levels = np.array([MODE_LEVELS[record['mode']] for record in records])
+    confidences = np.array([record['confidence'] for record in records], dtype=float)
+    energies = np.array([np.nan if record.get('energy') is None else record['energy']
+                         for record in records], dtype=float)
+    return times, levels, confidences, energies
+
+
+def downsample(times, values, t_start, t_end, columns):
+    """
+    Bucket a series into pixel columns over [t_start, t_end].
+
+    Returns bucket centres and the min, max and mean of each non-empty bucket.
+    Series that already fit in the columns are returned unchanged.
+    """
+    keep = ~np.isnan(values)
+    times, values = times[keep], values[keep]
+    if len(times) <= columns or t_end <= t_start:
+        return times, values, values, values
+
+    width = (t_end - t_start) / columns
+    buckets = np.clip(((times - t_start) / width).astype(int), 0, columns - 1)
+    # Times are sorted, so each bucket is a contiguous run
+    used, starts = np.unique(buckets, return_index=True)
+    lows = np.minimum.reduceat(values, starts)
+    highs = np.maximum.reduceat(values, starts)
+    counts = np.diff(np.append(starts, len(values)))
+    means = np.add.reduceat(values, starts) / counts
+    centres = t_start + (used + 0.5) * width
+    return centres, lows, highs, means
+
+
+class ModeTimeline:
+    """Timeline of mode, confidence and energy from detect_mode() results
+
+    Long ranges are downsampled to one min/max/mean bucket per pixel column.
+    New detections are drawn with blitting, so only the new segment is
+    rendered instead of the whole figure.
+    """
+
+    SERIES = [
+        ('Mode', (-1.2, 1.2), 'purple'),
+        ('Confidence', (0, 1.05), 'blue'),
+        ('Energy', (0, 10.5), 'orange'),
+    ]
+
+    def __init__(self, records=None, figsize=(12, 8), dpi=100):
+        self.fig, self.axes = plt.subplots(3, 1, figsize=figsize, dpi=dpi, sharex=True)
+        self.fig.suptitle('Consciousness Mode Timeline', fontsize=16, fontweight='bold')
+        self.times = []
+        self.values = [[], [], []]
+        self._live = []
+        self._live_from = 0
+        self._segments = []
+        if records:
+            # Sort once up front; append() keeps the order with bisect
+            times, *values = _records_arrays(records)
+            order = np.argsort(times, kind='stable')
+            self.times = times[order].tolist()
+            self.values = [series[order].tolist() for series in values]
+        self.redraw()
+
+    def _store(self, record):
+        """Insert a record in time order and return its position"""
+        t, *values = _record_values(record)
+        # downsample() relies on times being sorted, so late detections
+        # are slotted into place rather than appended
+        position = bisect.bisect_right(self.times, t)
+        self.times.insert(position, t)
+        for series, value in zip(self.values, values):
+            series.insert(position, value)
+        return position
+
+    def _span(self, headroom=True):
+        """X range of the data, with headroom so live updates rarely force
+        a redraw"""
+        if not self.times:
+            now = mdates.date2num(datetime.now())
+            return now, now + 1 / 24
+        start, end = self.times[0], self.times[-1]
+        length = max(end - start, 1 / 24)
+        return start, start + length * (1.25 if headroom else 1)
+
+    def redraw(self, headroom=True):
+        """Full render of the stored detections, downsampled per pixel column
+
+        headroom leaves space after the latest detection for live updates;
+        static exports turn it off.
+        """
+        t_start, t_end = self._span(headroom)
+        times = np.array(self.times)
+        for ax, (label, ylim, color), values in zip(self.axes, self.SERIES, self.values):
+            ax.clear()
+            ax.set_ylabel(label, fontsize=12)
+            ax.set_ylim(*ylim)
+            ax.grid(True, alpha=0.3)
+            columns = max(int(ax.bbox.width), 1)
+            x, lows, highs, means = downsample(times, np.array(values, dtype=float),
+                                               t_start, t_end, columns)
+            ax.fill_between(x, lows, highs, color=color, alpha=0.2, linewidth=0)
+            ax.plot(x, means, color=color, linewidth=1.5)
+        self.axes[0].set_yticks([-1, 0, 1])
+        self.axes[0].set_yticklabels(['Transformation', 'Mixed', 'Creation'])
+        self.axes[-1].set_xlim(t_start, t_end)
+        self.axes[-1].xaxis.set_major_formatter(
+            mdates.ConciseDateFormatter(self.axes[-1].xaxis.get_major_locator()))
+
+        # Segments are animated, so only append() draws them; the live lines
+        # hold every point blitted since this redraw, so a full draw by the
+        # backend (e.g. on resize) still shows them
+        self._live, self._segments = [], []
+        self._live_from = max(len(self.times) - 1, 0)
+        for ax, (_, _, color) in zip(self.axes, self.SERIES):
+            live, = ax.plot([], [], color=color, linewidth=1.5)
+            segment, = ax.plot([], [], color=color, linewidth=1.5, animated=True)
+            self._live.append(live)
+            self._segments.append(segment)
+        self.fig.canvas.draw()
+
+    def append(self, record):
+        """Add one detection, blitting only the segment it adds
+
+        A detection older than the latest one changes the drawn line in the
+        middle, so it forces a full redraw.
+        """
+        position = self._store(record)
+        if (len(self.times) < 2 or position < len(self.times) - 1 or
+                self.times[-1] > self.axes[-1].get_xlim()[1]):
+            self.redraw()
+            return
+
+        # Earlier segments stay in the canvas buffer, so there is no
+        # background to restore: draw the new segment over it and blit
+        # just the pixels around it
+        canvas = self.fig.canvas
+        renderer = canvas.get_renderer()
+        for ax, live, segment, values in zip(self.axes, self._live, self._segments,
+                                             self.values):
+            live.set_data(self.times[self._live_from:], values[self._live_from:])
+            segment.set_data(self.times[-2:], values[-2:])
+            ax.draw_artist(segment)
+            pad = segment.get_linewidth() * self.fig.dpi / 72
+            region = Bbox.intersection(segment.get_window_extent(renderer).padded(pad),
+                                       ax.bbox)
+            if region is not None:
+                canvas.blit(region)
+
+    def save_png(self, filename='mode-timeline.png'):
+        """Export the current timeline as a static PNG
+
+        The x axis ends at the latest detection; the next append() restores
+        the live headroom.
+        """
+        self.redraw(headroom=False)
+        self.fig.savefig(filename, dpi=self.fig.dpi)
+
+    def save_frames(self, records, directory='mode-timeline-frames'):
+        """Replay detections live and write one PNG frame per detection"""
+        os.makedirs(directory, exist_ok=True)
+        filenames = []
+        for i, record in enumerate(records):
+            self.append(record)
+            filename = os.path.join(directory, f'frame-{i:05d}.png')
+            plt.imsave(filename, np.asarray(self.fig.canvas.buffer_rgba()))
+            filenames.append(filename)
+        return filenames
+
+    def close(self):
+        """Close the timeline's figure and release its resources"""
+        plt.close(self.fig)
+
+
+def create_mode_timeline(log_path, filename='mode-timeline.png'):
+    """Render a stored detection log as a static timeline PNG"""
+    timeline = ModeTimeline(load_detection_log(log_path))
+    timeline.save_png(filename)
+    timeline.close()
+
+
 if __name__ == "__main__":
     print("Generating consciousness physics visualizations...")
     
@@ -174,5 +423,10 @@ if __name__ == "__main__":
     create_practical_applications()
     print("✓ Created practical-applications.png")
     
+    # Timeline needs a detection log (one detection_record() per line)
+    if os.path.exists('mode-log.jsonl'):
+        create_mode_timeline('mode-log.jsonl')
+        print("✓ Created mode-timeline.png")
+    
     print("\nAll visualizations created successfully!")
     print("These can be added to the repository or used in presentations.")
\ No newline at end of file
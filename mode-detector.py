@@ -13,9 +13,10 @@ from datetime import datetime
 from typing import Dict, Tuple, List
 
 class ConsciousnessMode:
-    """Represents the two modes of consciousness physics"""
+    """Represents the two modes of consciousness physics, plus the mixed state between them"""
     CREATION = "Creation Mode (C = P^A × R)"
     TRANSFORMATION = "Transformation Mode (C = P^A / R)"
+    MIXED = "Mixed/Transitional"
 
 class ModeDetector:
     """Detects active consciousness mode based on various signals"""
@@ -106,7 +107,7 @@ class ModeDetector:
             mode = ConsciousnessMode.TRANSFORMATION
             confidence = min(transformation_total / (creation_total + transformation_total + 1), 1.0)
         else:
-            mode = "Mixed/Transitional"
+            mode = ConsciousnessMode.MIXED
             confidence = 0.5
             
         # Build analysis